@@ -4,8 +4,10 @@ Accessible, user-friendly interface for elderly and disabled users.
 """
 import streamlit as st
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 from src.providers import (
+    LLMResponse,
     HuggingFaceProvider,
     GeminiProvider,
     GroqProvider,
@@ -14,6 +16,7 @@ from src.providers import (
 )
 from src.router import MultiLLMRouter, UseCase
 from src.evaluator import ResponseEvaluator
+from src.cache import ExactCache, SemanticCache
 
 # Load environment variables
 load_dotenv()
@@ -26,79 +29,35 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for accessibility
-st.markdown("""
-    <style>
-    /* Larger, more readable text */
-    .stTextInput > label, .stSelectbox > label, .stTextArea > label {
-        font-size: 1.3rem !important;
-        font-weight: 600 !important;
-    }
-    
-    .stButton > button {
-        font-size: 1.2rem !important;
-        padding: 0.75rem 1.5rem !important;
-        font-weight: 600 !important;
-    }
-    
-    /* High contrast */
-    .stTextInput > div > div > input {
-        font-size: 1.1rem !important;
-    }
-    
-    .stTextArea > div > div > textarea {
-        font-size: 1.1rem !important;
-    }
-    
-    /* Response cards */
-    .response-card {
-        background-color: #f0f2f6;
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        margin: 1rem 0;
-        border-left: 4px solid #4CAF50;
-    }
-    
-    .error-card {
-        background-color: #ffebee;
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        margin: 1rem 0;
-        border-left: 4px solid #f44336;
-    }
-    
-    /* Metrics */
-    .metric-container {
-        background-color: #e3f2fd;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 0.5rem 0;
-    }
-    
-    h1 {
-        font-size: 2.5rem !important;
-    }
-    
-    h2 {
-        font-size: 2rem !important;
-    }
-    
-    h3 {
-        font-size: 1.5rem !important;
-    }
-    </style>
-""", unsafe_allow_html=True)
+@st.cache_data
+def load_css():
+    """Read the accessibility stylesheet once per process."""
+    return (Path(__file__).parent / "assets" / "style.css").read_text()
+
+
+# Custom CSS for accessibility. Streamlit clears the page on every rerun,
+# so the styles are re-emitted each time; only the file read is cached.
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
 
 # Initialize session state
-if 'router' not in st.session_state:
-    st.session_state.router = None
 if 'responses' not in st.session_state:
     st.session_state.responses = None
 
 
+@st.cache_resource(show_spinner="Setting up AI models...")
 def initialize_router():
-    """Initialize the router with all available providers."""
-    router = MultiLLMRouter()
+    """
+    Initialize the router with all available providers.
+    
+    Cached per process so reruns and sessions share one router and its
+    provider clients.
+    """
+    # Identical questions are answered from disk, even across restarts;
+    # paraphrases of earlier questions are matched semantically
+    router = MultiLLMRouter(
+        cache=SemanticCache(path="./.semantic_cache"),
+        response_cache=ExactCache()
+    )
     
     # Get API keys from environment
     hf_key = os.getenv("HUGGINGFACE_API_KEY")
@@ -130,39 +89,48 @@ def initialize_router():
     router.register_provider("ollama", OllamaProvider(base_url=ollama_url))
     providers_registered.append("Ollama (local)")
     
+    # Connect now so the first question does not pay for DNS and TLS setup
+    router.warmup()
+    
     return router, providers_registered
 
 
+def display_metrics(response, evaluation):
+    """Display the metrics of a successful response."""
+    st.markdown(f"**Model:** {response.model_name}")
+    if response.cached:
+        st.caption("♻️ Reused from an earlier similar question")
+    
+    # Metrics
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Response Time", f"{evaluation['latency']:.2f}s", 
+                 delta=evaluation['speed_rating'])
+    with col2:
+        if evaluation.get('tokens_used'):
+            st.metric("Tokens Used", evaluation['tokens_used'])
+    with col3:
+        st.metric("Cost", f"${evaluation['cost']:.4f}")
+    
+    # Readability
+    readability = evaluation.get('readability', {})
+    if 'interpretation' in readability:
+        st.info(f"📖 Readability: {readability['interpretation']}")
+
+
 def display_response(name, response, evaluation):
     """Display a single response with metrics."""
     if evaluation.get("success"):
         st.markdown(f"### 🤖 {name}")
-        st.markdown(f"**Model:** {response.model_name}")
-        
-        # Metrics
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Response Time", f"{evaluation['latency']:.2f}s", 
-                     delta=evaluation['speed_rating'])
-        with col2:
-            if evaluation.get('tokens_used'):
-                st.metric("Tokens Used", evaluation['tokens_used'])
-        with col3:
-            st.metric("Cost", f"${evaluation['cost']:.4f}")
-        
-        # Readability
-        readability = evaluation.get('readability', {})
-        if 'interpretation' in readability:
-            st.info(f"📖 Readability: {readability['interpretation']}")
+        display_metrics(response, evaluation)
         
         # Response text
         st.markdown("**Response:**")
-        st.markdown(f"<div class='response-card'>{response.content}</div>", 
-                   unsafe_allow_html=True)
+        with st.container(border=True):
+            st.markdown(response.content)
     else:
         st.markdown(f"### ❌ {name}")
-        st.markdown(f"<div class='error-card'>**Error:** {evaluation.get('error', 'Unknown error')}</div>", 
-                   unsafe_allow_html=True)
+        st.error(f"**Error:** {evaluation.get('error', 'Unknown error')}")
 
 
 def main():
@@ -189,16 +157,11 @@ def main():
         st.markdown("---")
         
         # Initialize router
-        if st.session_state.router is None:
-            with st.spinner("Setting up AI models..."):
-                st.session_state.router, providers = initialize_router()
-            
-            st.success(f"✅ {len(providers)} providers ready!")
-            for provider in providers:
-                st.markdown(f"- {provider}")
-        else:
-            providers = st.session_state.router.list_providers()
-            st.success(f"✅ {len(providers)} providers active")
+        router, providers = initialize_router()
+        
+        st.success(f"✅ {len(providers)} providers ready!")
+        for provider in providers:
+            st.markdown(f"- {provider}")
         
         st.markdown("---")
         st.markdown("**Need API Keys?**")
@@ -211,9 +174,7 @@ def main():
         """)
     
     # Main content
-    router = st.session_state.router
-    
-    if router is None:
+    if not router.list_providers():
         st.error("Please set up at least one API key in your .env file")
         return
     
@@ -264,12 +225,27 @@ def main():
     # Process queries
     if prompt:
         if single_query:
+            st.markdown("---")
+            st.subheader("📝 Answer")
+            
+            # Show the answer as it is written; the final item is the response
+            result = {}
+            
+            def answer_chunks():
+                for item in router.stream_best_for_use_case(prompt, selected_use_case):
+                    if isinstance(item, LLMResponse):
+                        result["response"] = item
+                    else:
+                        yield item
+            
             with st.spinner("🤔 Thinking..."):
-                response = router.query_best_for_use_case(prompt, selected_use_case)
-                evaluation = ResponseEvaluator.evaluate_response(response)
-                
-                st.markdown("---")
-                st.subheader("📝 Answer")
+                st.write_stream(answer_chunks())
+            
+            response = result["response"]
+            evaluation = ResponseEvaluator.evaluate_response(response)
+            if evaluation.get("success"):
+                display_metrics(response, evaluation)
+            else:
                 display_response("Best Model", response, evaluation)
         
         elif compare_all:
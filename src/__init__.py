@@ -1,20 +1,43 @@
 """
 Multi-LLM System - Democratizing AI evaluation and selection.
+
+Public names are imported on first access to keep start-up fast.
 """
-from .providers import (
-    BaseLLMProvider,
-    LLMResponse,
-    HuggingFaceProvider,
-    GeminiProvider,
-    GroqProvider,
-    OllamaProvider,
-    OpenRouterProvider
-)
-from .router import MultiLLMRouter, UseCase
-from .evaluator import ResponseEvaluator
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .providers import (
+        BaseLLMProvider,
+        LLMResponse,
+        HuggingFaceProvider,
+        GeminiProvider,
+        GroqProvider,
+        OllamaProvider,
+        OpenRouterProvider
+    )
+    from .router import MultiLLMRouter, UseCase
+    from .evaluator import ResponseEvaluator
+    from .cache import LLMCache, ExactCache, SemanticCache
 
 __version__ = "1.0.0"
 
+_LAZY = {
+    'BaseLLMProvider': '.providers',
+    'LLMResponse': '.providers',
+    'HuggingFaceProvider': '.providers',
+    'GeminiProvider': '.providers',
+    'GroqProvider': '.providers',
+    'OllamaProvider': '.providers',
+    'OpenRouterProvider': '.providers',
+    'MultiLLMRouter': '.router',
+    'UseCase': '.router',
+    'ResponseEvaluator': '.evaluator',
+    'LLMCache': '.cache',
+    'ExactCache': '.cache',
+    'SemanticCache': '.cache'
+}
+
 __all__ = [
     'BaseLLMProvider',
     'LLMResponse',
@@ -25,5 +48,21 @@ __all__ = [
     'OpenRouterProvider',
     'MultiLLMRouter',
     'UseCase',
-    'ResponseEvaluator'
+    'ResponseEvaluator',
+    'LLMCache',
+    'ExactCache',
+    'SemanticCache'
 ]
+
+
+def __getattr__(name):
+    """Import a submodule the first time one of its names is used."""
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
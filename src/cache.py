@@ -0,0 +1,608 @@
+"""
+Response caching for Multi-LLM System.
+Serves repeated or paraphrased prompts without calling a provider again.
+"""
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, replace
+from typing import Any, Dict, List, Optional, Set, Tuple
+from .providers.base import LLMResponse
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+
+def _dump_response(response: LLMResponse):
+    """Serialize a response for storage."""
+    return _json.dumps(asdict(response))
+
+
+def _load_response(data) -> LLMResponse:
+    """Rebuild a response stored by ``_dump_response``."""
+    return LLMResponse(**_json.loads(data))
+
+
+class LLMCache:
+    """
+    In-process response cache with LRU eviction and per-entry expiry.
+    """
+    
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = 3600):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            ttl: Default seconds before an entry expires (None keeps entries
+                until evicted)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[Optional[float], LLMResponse]]" = OrderedDict()
+    
+    @staticmethod
+    def make_key(model_name: str, prompt: str, params: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a request.
+        
+        Args:
+            model_name: Model answering the request
+            prompt: The input prompt
+            params: Generation parameters (temperature, max_tokens, ...)
+        
+        Returns:
+            Hex digest identifying the request
+        """
+        return hashlib.blake2b(
+            repr((model_name, prompt, sorted(params.items()))).encode("utf-8")
+        ).hexdigest()
+    
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Key from ``make_key``
+        
+        Returns:
+            Cached LLMResponse or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+    
+    def set(self, key: str, response: LLMResponse, ttl: Optional[float] = None):
+        """
+        Store a response.
+        
+        Args:
+            key: Key from ``make_key``
+            response: Response to cache
+            ttl: Seconds before the entry expires (default: the cache's ttl)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (expires_at, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Remove all cached responses."""
+        self._entries.clear()
+
+
+class ExactCache(LLMCache):
+    """
+    Persistent exact-match response cache.
+    
+    Backed by diskcache when installed, otherwise by the in-process LRU.
+    """
+    
+    def __init__(
+        self,
+        directory: str = "./.llm_cache",
+        ttl: Optional[float] = 86400,
+        max_entries: int = 1024
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            directory: Directory for the on-disk store
+            ttl: Seconds before an entry expires (None keeps entries forever)
+            max_entries: In-process entry limit when diskcache is unavailable
+        """
+        super().__init__(max_entries=max_entries, ttl=ttl)
+        try:
+            import diskcache
+            self._store = diskcache.Cache(directory)
+        except ImportError:
+            self._store = None
+    
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Key from ``make_key``
+        
+        Returns:
+            Cached LLMResponse or None on a miss
+        """
+        if self._store is None:
+            return super().get(key)
+        data = self._store.get(key)
+        return _load_response(data) if data is not None else None
+    
+    def set(self, key: str, response: LLMResponse, ttl: Optional[float] = None):
+        """
+        Store a response.
+        
+        Args:
+            key: Key from ``make_key``
+            response: Response to cache
+            ttl: Seconds before the entry expires (default: the cache's ttl)
+        """
+        if self._store is None:
+            super().set(key, response, ttl=ttl)
+            return
+        self._store.set(
+            key,
+            _dump_response(response),
+            expire=self.ttl if ttl is None else ttl
+        )
+    
+    def clear(self):
+        """Remove all cached responses."""
+        if self._store is not None:
+            self._store.clear()
+        super().clear()
+
+
+class SemanticCache:
+    """
+    Two-tier prompt cache.
+    
+    Exact repeats are answered from a hash lookup; paraphrases are matched by
+    cosine similarity of sentence embeddings when sentence-transformers and
+    faiss are installed. Responses and embeddings live in SQLite; each
+    namespace has its own faiss index, which starts flat and is rebuilt as
+    IVF-PQ once it grows past IVF_THRESHOLD entries. Entries expire after
+    ``ttl`` seconds, and the oldest are dropped beyond ``max_entries``.
+    """
+    
+    # Entries in a namespace before its flat index is rebuilt as IVF-PQ
+    IVF_THRESHOLD = 10000
+    # Product quantizer layout (48 x 8 bits suits 384-d MiniLM vectors);
+    # dimensions 48 does not divide use their largest divisor below it
+    PQ_SUBQUANTIZERS = 48
+    PQ_BITS = 8
+    # IVF lists probed per search
+    NPROBE = 8
+    # PQ scores are approximate, so IVF searches over-fetch this many
+    # candidates per result and re-score them exactly
+    REFINE_FACTOR = 16
+    
+    def __init__(
+        self,
+        embedding_model: str = "all-MiniLM-L6-v2",
+        threshold: float = 0.92,
+        path: Optional[str] = None,
+        ttl: Optional[float] = 86400,
+        max_entries: Optional[int] = 100000
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            embedding_model: sentence-transformers model used for embeddings
+            threshold: Minimum cosine similarity for a semantic hit
+            path: Optional directory used to persist the cache
+            ttl: Seconds before an entry expires (None keeps entries forever)
+            max_entries: Entries kept before the oldest are dropped (None
+                for no limit)
+        """
+        self.embedding_model = embedding_model
+        self.threshold = threshold
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._indexes: Dict[str, Any] = {}
+        self._ivf_namespaces: Set[str] = set()
+        self._encoder = None
+        # Guards the database and indexes; embedding runs outside it, so
+        # lookups from worker threads only queue behind index updates
+        self._lock = threading.RLock()
+        
+        if path:
+            os.makedirs(path, exist_ok=True)
+            database = os.path.join(path, "cache.sqlite3")
+        else:
+            database = ":memory:"
+        self._db = sqlite3.connect(database, check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                id INTEGER PRIMARY KEY,
+                namespace TEXT NOT NULL,
+                exact_key TEXT NOT NULL UNIQUE,
+                response BLOB NOT NULL,
+                embedding BLOB,
+                created_at REAL NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS indexes (
+                namespace TEXT PRIMARY KEY,
+                last_id INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(entries)")}
+        if "created_at" not in columns:
+            # Written before entries expired; their rows count as expired
+            self._db.execute(
+                "ALTER TABLE entries ADD COLUMN created_at REAL NOT NULL DEFAULT 0"
+            )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS entries_created_at ON entries (created_at)"
+        )
+        
+        if path:
+            self._load_indexes()
+    
+    @staticmethod
+    def _exact_key(prompt: str, namespace: str) -> str:
+        """Hash a prompt for the exact-match tier."""
+        return hashlib.blake2b(
+            f"{namespace}\x00{prompt}".encode("utf-8")
+        ).hexdigest()
+    
+    def _cutoff(self) -> float:
+        """Return the creation time before which entries have expired."""
+        return time.time() - self.ttl if self.ttl is not None else 0.0
+    
+    def _index_file(self, namespace: str) -> str:
+        """Return the faiss index file for a namespace."""
+        name = hashlib.blake2b(namespace.encode("utf-8"), digest_size=8).hexdigest()
+        return os.path.join(self.path, f"{name}.faiss")
+    
+    def _get_encoder(self):
+        """Lazy initialization of the embedding model."""
+        with self._lock:
+            if self._encoder is None:
+                try:
+                    import faiss  # noqa: F401
+                    from sentence_transformers import SentenceTransformer
+                    self._encoder = SentenceTransformer(self.embedding_model)
+                except ImportError:
+                    pass
+            return self._encoder
+    
+    def _embed(self, prompt: str):
+        """Return the L2-normalized embedding for a prompt, or None."""
+        encoder = self._get_encoder()
+        if encoder is None:
+            return None
+        return encoder.encode(
+            [prompt],
+            normalize_embeddings=True
+        ).astype("float32")
+    
+    def search(self, vector, namespace: str = "", k: int = 1) -> List[Tuple[int, float]]:
+        """
+        Find the stored prompts nearest to an embedding.
+        
+        Args:
+            vector: L2-normalized query embedding, shape (1, dim)
+            namespace: Partition to search
+            k: Number of neighbours
+        
+        Returns:
+            List of (entry id, cosine score), best first
+        """
+        index = self._indexes.get(namespace)
+        if index is None or index.ntotal == 0:
+            return []
+        
+        refine = namespace in self._ivf_namespaces
+        scores, ids = index.search(vector, k * self.REFINE_FACTOR if refine else k)
+        results = [
+            (int(entry_id), float(score))
+            for entry_id, score in zip(ids[0], scores[0])
+            if entry_id >= 0
+        ]
+        if refine and results:
+            results = self._rescore(vector, [entry_id for entry_id, _ in results])
+        return results[:k]
+    
+    def _rescore(self, vector, entry_ids: List[int]) -> List[Tuple[int, float]]:
+        """Score candidates exactly against their stored embeddings."""
+        import numpy as np
+        
+        rows = self._db.execute(
+            f"SELECT id, embedding FROM entries WHERE id IN ({','.join('?' * len(entry_ids))})",
+            entry_ids
+        ).fetchall()
+        scored = [
+            (row[0], float(np.dot(vector[0], np.frombuffer(row[1], dtype="float32"))))
+            for row in rows
+        ]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored
+    
+    def get(self, prompt: str, namespace: str = "") -> Optional[LLMResponse]:
+        """
+        Look up a cached response.
+        
+        Embedding the prompt blocks, so async callers should run this in a
+        worker thread.
+        
+        Args:
+            prompt: The input prompt
+            namespace: Partition key (e.g. use case), so unrelated
+                queries never share answers
+        
+        Returns:
+            Cached LLMResponse marked ``cached`` with zero latency, or None
+            on a miss
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT response FROM entries WHERE exact_key = ? AND created_at >= ?",
+                (self._exact_key(prompt, namespace), self._cutoff())
+            ).fetchone()
+            if row is not None:
+                return replace(_load_response(row[0]), latency=0.0, cached=True)
+            
+            if namespace not in self._indexes:
+                return None
+        
+        vector = self._embed(prompt)
+        if vector is None:
+            return None
+        
+        with self._lock:
+            for entry_id, score in self.search(vector, namespace, k=1):
+                if score >= self.threshold:
+                    # Payload is only fetched once the match clears the threshold
+                    row = self._db.execute(
+                        "SELECT response FROM entries WHERE id = ? AND created_at >= ?",
+                        (entry_id, self._cutoff())
+                    ).fetchone()
+                    if row is not None:
+                        return replace(_load_response(row[0]), latency=0.0, cached=True)
+        return None
+    
+    def put(self, prompt: str, response: LLMResponse, namespace: str = ""):
+        """
+        Store a successful response.
+        
+        Embedding the prompt and rebuilding an index block, so async callers
+        should run this in a worker thread.
+        
+        Args:
+            prompt: The input prompt
+            response: Response to cache
+            namespace: Partition key (e.g. use case)
+        """
+        if not response.success:
+            return
+        
+        vector = self._embed(prompt)
+        with self._lock:
+            self._store(prompt, response, namespace, vector)
+    
+    def _store(self, prompt: str, response: LLMResponse, namespace: str, vector):
+        """Insert an entry and index its embedding; called with the lock held."""
+        self._prune()
+        with self._db:
+            cursor = self._db.execute(
+                "INSERT OR IGNORE INTO entries "
+                "(namespace, exact_key, response, embedding, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    namespace,
+                    self._exact_key(prompt, namespace),
+                    _dump_response(response),
+                    vector.tobytes() if vector is not None else None,
+                    time.time()
+                )
+            )
+            if vector is not None:
+                self._db.execute(
+                    "INSERT OR IGNORE INTO meta VALUES ('embedding_model', ?)",
+                    (self.embedding_model,)
+                )
+        
+        # Already cached, or nothing to index
+        if cursor.rowcount == 0 or vector is None:
+            return
+        
+        import faiss
+        import numpy as np
+        
+        index = self._indexes.get(namespace)
+        if index is None:
+            index = faiss.IndexIDMap2(faiss.IndexFlatIP(vector.shape[1]))
+            self._indexes[namespace] = index
+        index.add_with_ids(vector, np.array([cursor.lastrowid], dtype="int64"))
+        
+        if namespace not in self._ivf_namespaces and index.ntotal > self.IVF_THRESHOLD:
+            self._rebuild_ivf(namespace)
+    
+    def _prune(self):
+        """
+        Drop expired entries, then the oldest ones to make room for one
+        more under max_entries; called with the lock held.
+        """
+        cutoff = self._cutoff()
+        doomed = self._db.execute(
+            "SELECT id, namespace FROM entries WHERE created_at < ?", (cutoff,)
+        ).fetchall()
+        if self.max_entries is not None:
+            live = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0] - len(doomed)
+            excess = live - self.max_entries + 1
+            if excess > 0:
+                doomed += self._db.execute(
+                    "SELECT id, namespace FROM entries WHERE created_at >= ? "
+                    "ORDER BY created_at LIMIT ?",
+                    (cutoff, excess)
+                ).fetchall()
+        if not doomed:
+            return
+        
+        with self._db:
+            self._db.executemany(
+                "DELETE FROM entries WHERE id = ?",
+                [(entry_id,) for entry_id, _ in doomed]
+            )
+        
+        removed: Dict[str, List[int]] = {}
+        for entry_id, namespace in doomed:
+            if namespace in self._indexes:
+                removed.setdefault(namespace, []).append(entry_id)
+        if removed:
+            import numpy as np
+            for namespace, entry_ids in removed.items():
+                self._indexes[namespace].remove_ids(np.array(entry_ids, dtype="int64"))
+    
+    def _rebuild_ivf(self, namespace: str):
+        """Replace a namespace's flat index with a trained IVF-PQ index."""
+        import faiss
+        import numpy as np
+        
+        rows = self._db.execute(
+            "SELECT id, embedding FROM entries "
+            "WHERE namespace = ? AND embedding IS NOT NULL",
+            (namespace,)
+        ).fetchall()
+        vectors = np.vstack([np.frombuffer(row[1], dtype="float32") for row in rows])
+        
+        dim = vectors.shape[1]
+        subquantizers = max(
+            m for m in range(1, self.PQ_SUBQUANTIZERS + 1) if dim % m == 0
+        )
+        
+        quantizer = faiss.IndexFlatIP(dim)
+        index = faiss.IndexIVFPQ(
+            quantizer,
+            dim,
+            max(1, int(math.sqrt(len(rows)))),
+            subquantizers,
+            self.PQ_BITS,
+            faiss.METRIC_INNER_PRODUCT
+        )
+        index.train(vectors)
+        index.add_with_ids(vectors, np.array([row[0] for row in rows], dtype="int64"))
+        index.nprobe = self.NPROBE
+        
+        self._indexes[namespace] = index
+        self._ivf_namespaces.add(namespace)
+        self.save()
+    
+    def clear_embeddings(self):
+        """Drop the semantic tier, keeping exact-match entries."""
+        with self._lock:
+            if self.path:
+                for (namespace,) in self._db.execute("SELECT namespace FROM indexes").fetchall():
+                    index_file = self._index_file(namespace)
+                    if os.path.exists(index_file):
+                        os.remove(index_file)
+            with self._db:
+                self._db.execute("UPDATE entries SET embedding = NULL")
+                self._db.execute("DELETE FROM indexes")
+                self._db.execute("DELETE FROM meta")
+            self._indexes.clear()
+            self._ivf_namespaces.clear()
+    
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock:
+            self.clear_embeddings()
+            with self._db:
+                self._db.execute("DELETE FROM entries")
+    
+    def save(self):
+        """Write the faiss indexes to ``path``; entries are stored on put."""
+        with self._lock:
+            if not self.path or not self._indexes:
+                return
+            import faiss
+            
+            with self._db:
+                for namespace, index in self._indexes.items():
+                    faiss.write_index(index, self._index_file(namespace))
+                    last_id = self._db.execute(
+                        "SELECT MAX(id) FROM entries WHERE namespace = ?", (namespace,)
+                    ).fetchone()[0]
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO indexes VALUES (?, ?)",
+                        (namespace, last_id or 0)
+                    )
+    
+    def _load_indexes(self):
+        """Load saved faiss indexes, indexing entries stored since the save."""
+        row = self._db.execute(
+            "SELECT value FROM meta WHERE key = 'embedding_model'"
+        ).fetchone()
+        if row is not None and row[0] != self.embedding_model:
+            # Embeddings from a different model are not comparable
+            self.clear_embeddings()
+            return
+        
+        namespaces = [
+            namespace for (namespace,) in self._db.execute(
+                "SELECT DISTINCT namespace FROM entries WHERE embedding IS NOT NULL"
+            ).fetchall()
+        ]
+        if not namespaces:
+            return
+        try:
+            import faiss
+            import numpy as np
+        except ImportError:
+            return
+        
+        saved = dict(self._db.execute("SELECT namespace, last_id FROM indexes").fetchall())
+        for namespace in namespaces:
+            index = None
+            last_id = 0
+            index_file = self._index_file(namespace)
+            if namespace in saved and os.path.exists(index_file):
+                index = faiss.read_index(index_file)
+                last_id = saved[namespace]
+                if isinstance(index, faiss.IndexIVF):
+                    index.nprobe = self.NPROBE
+                    self._ivf_namespaces.add(namespace)
+            
+            rows = self._db.execute(
+                "SELECT id, embedding FROM entries "
+                "WHERE namespace = ? AND id > ? AND embedding IS NOT NULL",
+                (namespace, last_id)
+            ).fetchall()
+            if rows:
+                vectors = np.vstack([np.frombuffer(row[1], dtype="float32") for row in rows])
+                if index is None:
+                    index = faiss.IndexIDMap2(faiss.IndexFlatIP(vectors.shape[1]))
+                index.add_with_ids(vectors, np.array([row[0] for row in rows], dtype="int64"))
+            if index is None:
+                continue
+            
+            self._indexes[namespace] = index
+            if namespace not in self._ivf_namespaces and index.ntotal > self.IVF_THRESHOLD:
+                self._rebuild_ivf(namespace)
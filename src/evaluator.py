@@ -2,10 +2,74 @@
 Response evaluator for Multi-LLM System.
 Provides readability scoring and response quality metrics.
 """
-from typing import Dict, Any
+import math
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 from .providers.base import LLMResponse
 
 
+# Flesch Reading Ease lower bounds and their interpretations
+_READABILITY_THRESHOLDS = (30, 50, 60, 70, 80, 90)
+_READABILITY_LABELS = (
+    "Very Difficult (College graduate)",
+    "Difficult (College)",
+    "Fairly Difficult (10th-12th grade)",
+    "Standard (8th-9th grade)",
+    "Fairly Easy (7th grade)",
+    "Easy (6th grade)",
+    "Very Easy (5th grade)"
+)
+
+# Latency upper bounds (seconds) and their speed ratings
+_SPEED_THRESHOLDS = (1.0, 3.0, 5.0, 10.0)
+_SPEED_LABELS = ("Very Fast", "Fast", "Moderate", "Slow", "Very Slow")
+
+# Below this many words Flesch scores are too noisy to be worth computing
+_MIN_READABILITY_WORDS = 20
+
+# Sentence terminators; a run like "..." or "?!" ends one sentence
+_SENTENCE_END_RE = re.compile(r"[.!?]+")
+
+
+def _legacy_round(number: float, points: int) -> float:
+    """Round half away from zero, as textstat does."""
+    p = 10 ** points
+    return math.floor(number * p + math.copysign(0.5, number)) / p
+
+
+@lru_cache(maxsize=256)
+def _flesch_scores(text: str) -> Tuple[float, float, int]:
+    """
+    Compute Flesch scores from one set of word, sentence and syllable counts.
+    
+    Intermediate averages are rounded like textstat's, so the scores match
+    ``textstat.flesch_reading_ease`` and ``textstat.flesch_kincaid_grade``.
+    
+    Args:
+        text: Text to evaluate
+        
+    Returns:
+        Tuple of (reading ease, Flesch-Kincaid grade, sentence count)
+    """
+    import textstat
+    
+    words = textstat.lexicon_count(text, removepunct=True)
+    sentences = textstat.sentence_count(text)
+    syllables = textstat.syllable_count(text)
+    
+    if not words or not sentences or not syllables:
+        return 0.0, 0.0, sentences
+    
+    words_per_sentence = _legacy_round(words / sentences, 1)
+    syllables_per_word = _legacy_round(syllables / words, 1)
+    
+    reading_ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+    grade = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+    return _legacy_round(reading_ease, 2), _legacy_round(grade, 1), sentences
+
+
 class ResponseEvaluator:
     """Evaluator for LLM responses."""
     
@@ -20,46 +84,39 @@ class ResponseEvaluator:
         Returns:
             Dictionary with readability metrics
         """
+        words = text.split()
+        if len(words) < _MIN_READABILITY_WORDS:
+            return {
+                "word_count": len(words),
+                "sentence_count": 0,
+                "interpretation": "Too short for reliable score"
+            }
+        
         try:
-            import textstat
-            
             # Calculate various readability scores
-            flesch_reading_ease = textstat.flesch_reading_ease(text)
-            flesch_kincaid_grade = textstat.flesch_kincaid_grade(text)
+            flesch_reading_ease, flesch_kincaid_grade, sentence_count = _flesch_scores(text)
             
             # Interpret Flesch Reading Ease score
-            if flesch_reading_ease >= 90:
-                interpretation = "Very Easy (5th grade)"
-            elif flesch_reading_ease >= 80:
-                interpretation = "Easy (6th grade)"
-            elif flesch_reading_ease >= 70:
-                interpretation = "Fairly Easy (7th grade)"
-            elif flesch_reading_ease >= 60:
-                interpretation = "Standard (8th-9th grade)"
-            elif flesch_reading_ease >= 50:
-                interpretation = "Fairly Difficult (10th-12th grade)"
-            elif flesch_reading_ease >= 30:
-                interpretation = "Difficult (College)"
-            else:
-                interpretation = "Very Difficult (College graduate)"
+            interpretation = _READABILITY_LABELS[
+                bisect_right(_READABILITY_THRESHOLDS, flesch_reading_ease)
+            ]
             
             return {
                 "flesch_reading_ease": round(flesch_reading_ease, 2),
                 "flesch_kincaid_grade": round(flesch_kincaid_grade, 2),
                 "interpretation": interpretation,
-                "word_count": len(text.split()),
-                "sentence_count": textstat.sentence_count(text)
+                "word_count": len(words),
+                "sentence_count": sentence_count
             }
         except ImportError:
             # Fallback if textstat is not available
-            words = text.split()
-            sentences = text.count('.') + text.count('!') + text.count('?')
-            sentences = max(1, sentences)  # Avoid division by zero
+            word_count = len(words)
+            sentences = max(1, len(_SENTENCE_END_RE.findall(text)))  # Avoid division by zero
             
             return {
-                "word_count": len(words),
+                "word_count": word_count,
                 "sentence_count": sentences,
-                "avg_word_length": sum(len(w) for w in words) / max(1, len(words)),
+                "avg_word_length": sum(map(len, words)) / max(1, word_count),
                 "interpretation": "Basic metrics only (install textstat for full analysis)"
             }
     
@@ -83,23 +140,20 @@ class ResponseEvaluator:
         
         readability = ResponseEvaluator.calculate_readability(response.content)
         
-        # Speed rating
-        if response.latency < 1.0:
-            speed_rating = "Very Fast"
-        elif response.latency < 3.0:
-            speed_rating = "Fast"
-        elif response.latency < 5.0:
-            speed_rating = "Moderate"
-        elif response.latency < 10.0:
-            speed_rating = "Slow"
+        # Speed rating; a cached answer's zero latency says nothing about the model
+        if response.cached:
+            speed_rating = "Cached"
         else:
-            speed_rating = "Very Slow"
+            speed_rating = _SPEED_LABELS[
+                bisect_right(_SPEED_THRESHOLDS, response.latency)
+            ]
         
         return {
             "success": True,
             "model": response.model_name,
             "latency": round(response.latency, 2),
             "speed_rating": speed_rating,
+            "cached": response.cached,
             "tokens_used": response.tokens_used,
             "cost": response.estimated_cost,
             "readability": readability,
@@ -121,37 +175,41 @@ class ResponseEvaluator:
         for name, response in responses.items():
             evaluations[name] = ResponseEvaluator.evaluate_response(response)
         
-        # Find fastest successful response
-        successful = {
-            name: eval_data 
-            for name, eval_data in evaluations.items() 
-            if eval_data.get("success", False)
-        }
+        # Find the fastest (among fresh answers) and the most readable
+        # (highest Flesch Reading Ease, if available) successful responses
+        # in a single pass
+        successful_models = 0
+        fastest_model = None
+        fastest_latency = float('inf')
+        most_readable = None
+        highest_readability = float('-inf')
         
-        if successful:
-            fastest = min(
-                successful.items(),
-                key=lambda x: x[1].get("latency", float('inf'))
-            )
+        for name, eval_data in evaluations.items():
+            if not eval_data["success"]:
+                continue
+            successful_models += 1
             
-            # Find most readable (highest Flesch Reading Ease if available)
-            most_readable = None
-            highest_readability = float('-inf')
+            latency = eval_data["latency"]
+            if not eval_data["cached"] and latency < fastest_latency:
+                fastest_latency = latency
+                fastest_model = name
             
-            for name, eval_data in successful.items():
-                readability_score = eval_data.get("readability", {}).get("flesch_reading_ease", float('-inf'))
-                if readability_score > highest_readability and readability_score != float('-inf'):
-                    highest_readability = readability_score
-                    most_readable = name
-            
-            return {
+            readability_score = eval_data["readability"].get("flesch_reading_ease")
+            if readability_score is not None and readability_score > highest_readability:
+                highest_readability = readability_score
+                most_readable = name
+        
+        if successful_models:
+            comparison = {
                 "evaluations": evaluations,
-                "fastest_model": fastest[0],
-                "fastest_latency": fastest[1]["latency"],
                 "most_readable_model": most_readable,
                 "total_models": len(responses),
-                "successful_models": len(successful)
+                "successful_models": successful_models
             }
+            if fastest_model is not None:
+                comparison["fastest_model"] = fastest_model
+                comparison["fastest_latency"] = fastest_latency
+            return comparison
         else:
             return {
                 "evaluations": evaluations,
@@ -1,12 +1,29 @@
 """
 Provider modules for Multi-LLM System.
+
+Providers are imported on first access, so only the SDKs that are
+actually used get loaded.
 """
-from .base import BaseLLMProvider, LLMResponse
-from .huggingface import HuggingFaceProvider
-from .gemini import GeminiProvider
-from .groq import GroqProvider
-from .ollama import OllamaProvider
-from .openrouter import OpenRouterProvider
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import BaseLLMProvider, LLMResponse
+    from .huggingface import HuggingFaceProvider
+    from .gemini import GeminiProvider
+    from .groq import GroqProvider
+    from .ollama import OllamaProvider
+    from .openrouter import OpenRouterProvider
+
+_LAZY = {
+    'BaseLLMProvider': '.base',
+    'LLMResponse': '.base',
+    'HuggingFaceProvider': '.huggingface',
+    'GeminiProvider': '.gemini',
+    'GroqProvider': '.groq',
+    'OllamaProvider': '.ollama',
+    'OpenRouterProvider': '.openrouter'
+}
 
 __all__ = [
     'BaseLLMProvider',
@@ -17,3 +34,16 @@ __all__ = [
     'OllamaProvider',
     'OpenRouterProvider'
 ]
+
+
+def __getattr__(name):
+    """Import a provider module the first time one of its names is used."""
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,12 +2,190 @@
 Base provider abstract class for Multi-LLM System.
 """
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterator, List, Optional, Union
+import asyncio
+import os
+import sys
+import threading
 import time
+import httpx
+from email.utils import parsedate_to_datetime
+from importlib.util import find_spec
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception_type,
+    retry_if_result,
+    stop_after_attempt,
+    wait_exponential_jitter
+)
 
+if TYPE_CHECKING:
+    from ..cache import LLMCache
 
-@dataclass
+
+# Persistent event loop shared by the synchronous helpers, so each sync call
+# does not pay for creating and tearing down a fresh loop.
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, using uvloop's faster one when installed."""
+    try:
+        import uvloop
+        return uvloop.new_event_loop()
+    except ImportError:
+        return asyncio.new_event_loop()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting it on first use."""
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            _sync_loop = _new_event_loop()
+            threading.Thread(
+                target=_sync_loop.run_forever,
+                name="multi-llm-sync-loop",
+                daemon=True
+            ).start()
+    return _sync_loop
+
+
+def run_sync(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+    
+    Args:
+        coro: Coroutine to execute
+    
+    Returns:
+        The coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_sync_loop()).result()
+
+
+def iterate_sync(agen: AsyncIterator) -> Iterator:
+    """
+    Iterate an async generator from synchronous code.
+    
+    Args:
+        agen: Async generator to consume
+    
+    Yields:
+        Items produced by the async generator
+    """
+    try:
+        while True:
+            try:
+                yield run_sync(agen.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        run_sync(agen.aclose())
+
+
+# HTTP/2 multiplexes concurrent requests over one connection, but httpx
+# only supports it when the optional h2 package is installed
+_HAS_H2 = find_spec("h2") is not None
+
+
+def create_http_client(timeout: float, limits: httpx.Limits) -> httpx.AsyncClient:
+    """
+    Create a pooled HTTP client, using HTTP/2 when available.
+    
+    Args:
+        timeout: Default request timeout in seconds
+        limits: Connection pool limits
+        
+    Returns:
+        New httpx.AsyncClient
+    """
+    return httpx.AsyncClient(http2=_HAS_H2, timeout=timeout, limits=limits)
+
+
+class LoopLocalHTTPClient:
+    """
+    One pooled HTTP client per event loop.
+    
+    Pooled connections belong to the loop that opened them, so a single
+    client breaks once that loop closes (e.g. between ``asyncio.run``
+    calls) or when used from the synchronous helpers' background loop.
+    """
+    
+    def __init__(self, timeout: float, limits: httpx.Limits):
+        """
+        Initialize the client set.
+        
+        Args:
+            timeout: Default request timeout in seconds
+            limits: Connection pool limits for each client
+        """
+        self.timeout = timeout
+        self.limits = limits
+        self._clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+    
+    def get(self) -> httpx.AsyncClient:
+        """Return the client for the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            # Clients of closed loops hold no usable connections
+            for closed in [other for other in self._clients if other.is_closed()]:
+                del self._clients[closed]
+            client = self._clients[loop] = create_http_client(self.timeout, self.limits)
+        return client
+    
+    async def aclose(self):
+        """
+        Close every client.
+        
+        Clients of other loops still running are closed on their own loop.
+        """
+        current = asyncio.get_running_loop()
+        clients, self._clients = self._clients, {}
+        for loop, client in clients.items():
+            if loop is current:
+                await client.aclose()
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+
+# Backoff between retries when the server does not say how long to wait
+_BACKOFF = wait_exponential_jitter(initial=1, max=10)
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """
+    Parse a response's Retry-After header.
+    
+    Args:
+        response: HTTP response
+        
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+# Slots need Python 3.10+; older versions fall back to a regular __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class LLMResponse:
     """Standardized response format for all LLM providers."""
     model_name: str
@@ -16,6 +194,11 @@ class LLMResponse:
     tokens_used: Optional[int] = None
     estimated_cost: float = 0.0  # in USD
     error: Optional[str] = None
+    cached: bool = False  # served from the response cache
+    
+    def __post_init__(self):
+        # Model names repeat across every response and cache key
+        object.__setattr__(self, "model_name", sys.intern(self.model_name))
     
     @property
     def success(self) -> bool:
@@ -23,17 +206,131 @@ class LLMResponse:
         return self.error is None
 
 
+class CircuitBreaker:
+    """
+    Stops calling a provider that keeps failing.
+    
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are refused for ``cooldown`` seconds. Then a single trial call is
+    let through (half-open): success closes the circuit, failure opens it
+    again for another cooldown.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0):
+        """
+        Initialize the breaker.
+        
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown: Seconds the circuit stays open before a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+    
+    def allow(self) -> bool:
+        """
+        Check whether a call may go ahead.
+        
+        Returns:
+            True if the circuit is closed, or if this is the trial call
+            after the cooldown
+        """
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+            self.state = self.HALF_OPEN
+            return True
+        return False
+    
+    def record_success(self):
+        """Close the circuit after a successful call."""
+        self.state = self.CLOSED
+        self.failure_count = 0
+    
+    def record_failure(self):
+        """Count a failed call, opening the circuit at the threshold."""
+        self.failure_count += 1
+        if self.state == self.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            self.trip()
+    
+    def release(self):
+        """Give up a call without a verdict, e.g. when it was cancelled."""
+        if self.state == self.HALF_OPEN:
+            # Let the next caller make the trial call instead
+            self.state = self.OPEN
+    
+    def trip(self):
+        """Open the circuit immediately."""
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+
+
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    # Per-request timeout in seconds for HTTP-based providers
+    TIMEOUT = 60.0
+    
+    # Simultaneous requests allowed, kept below the free-tier rate limit
+    MAX_CONCURRENCY = 4
+    
+    # HTTP statuses worth retrying: rate limited, temporarily unavailable
+    RETRY_STATUS_CODES = frozenset({429, 503})
+    RETRY_ATTEMPTS = 3
+    # Network failures worth retrying (dropped connections, timeouts)
+    RETRY_EXCEPTIONS = (httpx.TransportError,)
+    # Longest Retry-After delay honoured before giving up on the wait
+    RETRY_AFTER_MAX = 30.0
+    
+    # Consecutive failures before the provider is skipped, and for how long
+    BREAKER_THRESHOLD = 5
+    BREAKER_COOLDOWN = 30.0
+    
+    # Connection pool size for the HTTP client a provider creates itself
+    HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[Union[httpx.AsyncClient, LoopLocalHTTPClient]] = None,
+        max_concurrency: Optional[int] = None
+    ):
         """
         Initialize the provider.
         
         Args:
             api_key: API key for the provider (if required)
+            http_client: Shared HTTP client to reuse connections across calls,
+                or a LoopLocalHTTPClient to share one per event loop
+                (default: pooled clients created on first use)
+            max_concurrency: Maximum simultaneous requests (default: the
+                ``<NAME>_MAX_CONCURRENCY`` environment variable, e.g.
+                ``GROQ_MAX_CONCURRENCY``, or MAX_CONCURRENCY)
         """
         self.api_key = api_key
+        self.http_client = http_client
+        self._owns_http_client = False
+        self.cache: Optional["LLMCache"] = None
+        self.max_concurrency = max_concurrency or self._env_concurrency() or self.MAX_CONCURRENCY
+        # Created on first use so it binds to the loop that runs the requests
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.breaker = CircuitBreaker(self.BREAKER_THRESHOLD, self.BREAKER_COOLDOWN)
+    
+    def _env_concurrency(self) -> Optional[int]:
+        """Read the concurrency limit for this provider from the environment."""
+        name = type(self).__name__
+        if name.endswith("Provider"):
+            name = name[:-len("Provider")]
+        value = os.getenv(f"{name.upper()}_MAX_CONCURRENCY")
+        return int(value) if value else None
     
     @abstractmethod
     def get_model_name(self) -> str:
@@ -41,18 +338,110 @@ class BaseLLMProvider(ABC):
         pass
     
     @abstractmethod
+    async def _generate_async(self, prompt: str, **kwargs) -> LLMResponse:
+        """
+        Call the provider's API. Implemented by each provider.
+        
+        Args:
+            prompt: The input prompt
+            **kwargs: Additional provider-specific parameters
+        
+        Returns:
+            LLMResponse object with model output and metadata
+        """
+        pass
+    
     async def generate_async(self, prompt: str, **kwargs) -> LLMResponse:
         """
         Generate a response asynchronously.
         
+        Identical requests are served from ``cache`` when one is set.
+        
         Args:
             prompt: The input prompt
+            **kwargs: Additional provider-specific parameters. Common ones:
+                ``system`` (system prompt sent ahead of the prompt) and
+                ``cache_prefix`` (mark the system prompt for server-side
+                prompt caching where the provider needs it)
+        
+        Returns:
+            LLMResponse object with model output and metadata
+        """
+        if self.cache is None:
+            return await self._generate_limited(prompt, **kwargs)
+        
+        key = self.cache.make_key(self.get_model_name(), prompt, kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return replace(cached, latency=0.0, cached=True)
+        
+        response = await self._generate_limited(prompt, **kwargs)
+        if response.success:
+            self.cache.set(key, response)
+        return response
+    
+    async def _generate_limited(self, prompt: str, **kwargs) -> LLMResponse:
+        """
+        Call the provider while holding one of its concurrency slots.
+        
+        Fails fast while the circuit breaker is open.
+        """
+        if not self.breaker.allow():
+            return LLMResponse(
+                model_name=self.get_model_name(),
+                content="",
+                latency=0.0,
+                error=self._circuit_open_error()
+            )
+        
+        try:
+            async with self._get_semaphore():
+                response = await self._generate_async(prompt, **kwargs)
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        
+        if response.success:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+        return response
+    
+    def _circuit_open_error(self) -> str:
+        """Describe a call refused by the open circuit breaker."""
+        return (
+            f"Circuit open: skipped for up to {self.breaker.cooldown:g}s "
+            "after repeated failures"
+        )
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the concurrency limit, recreated when the event loop changes."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    async def batch_generate(self, prompts: List[str], **kwargs) -> List[LLMResponse]:
+        """
+        Generate responses for many prompts.
+        
+        Sends one request per prompt, as many at a time as the concurrency
+        limit allows. Providers with a batch API override this.
+        
+        Args:
+            prompts: Input prompts
             **kwargs: Additional provider-specific parameters
             
         Returns:
-            LLMResponse object with model output and metadata
+            One LLMResponse per prompt, in the same order
         """
-        pass
+        return list(await asyncio.gather(
+            *(self.generate_async(prompt, **kwargs) for prompt in prompts)
+        ))
     
     def generate(self, prompt: str, **kwargs) -> LLMResponse:
         """
@@ -61,18 +450,177 @@ class BaseLLMProvider(ABC):
         Args:
             prompt: The input prompt
             **kwargs: Additional provider-specific parameters
-            
+        
         Returns:
             LLMResponse object with model output and metadata
         """
-        import asyncio
-        return asyncio.run(self.generate_async(prompt, **kwargs))
+        return run_sync(self.generate_async(prompt, **kwargs))
+    
+    async def _stream_async(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Call the provider's streaming API. Overridden by providers that
+        support streaming; by default the whole response is one chunk.
+        
+        Args:
+            prompt: The input prompt
+            **kwargs: Additional provider-specific parameters
+        
+        Yields:
+            Text chunks as they are produced
+        """
+        response = await self._generate_async(prompt, **kwargs)
+        if not response.success:
+            raise RuntimeError(response.error)
+        yield response.content
+    
+    async def stream_async(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream a response as text chunks.
+        
+        Holds one of the provider's concurrency slots for the whole stream
+        and fails fast while the circuit breaker is open.
+        
+        Args:
+            prompt: The input prompt
+            **kwargs: Additional provider-specific parameters
+        
+        Yields:
+            Text chunks as they are produced
+        
+        Raises:
+            RuntimeError: If the provider returns an error or the circuit
+                is open
+        """
+        if type(self)._stream_async is BaseLLMProvider._stream_async:
+            # No native streaming: generate_async applies the cache as well
+            # as the concurrency limit and the breaker
+            response = await self.generate_async(prompt, **kwargs)
+            if not response.success:
+                raise RuntimeError(response.error)
+            yield response.content
+            return
+        
+        if not self.breaker.allow():
+            raise RuntimeError(self._circuit_open_error())
+        
+        stream = self._stream_async(prompt, **kwargs)
+        try:
+            async with self._get_semaphore():
+                async for chunk in stream:
+                    yield chunk
+        except (asyncio.CancelledError, GeneratorExit):
+            # Abandoned by the caller, which says nothing about the provider
+            self.breaker.release()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        finally:
+            await stream.aclose()
+        self.breaker.record_success()
+    
+    def stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        """
+        Stream a response synchronously.
+        
+        Args:
+            prompt: The input prompt
+            **kwargs: Additional provider-specific parameters
+        
+        Yields:
+            Text chunks as they are produced
+        """
+        return iterate_sync(self.stream_async(prompt, **kwargs))
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the HTTP client, creating pooled ones on first use."""
+        if self.http_client is None:
+            # One per event loop, so separate asyncio.run calls both work
+            self.http_client = LoopLocalHTTPClient(self.TIMEOUT, self.HTTP_LIMITS)
+            self._owns_http_client = True
+        if isinstance(self.http_client, LoopLocalHTTPClient):
+            return self.http_client.get()
+        return self.http_client
+    
+    def _warmup_url(self) -> Optional[str]:
+        """Return a URL on the provider's host for ``warmup``, or None to skip it."""
+        return None
+    
+    async def warmup(self):
+        """
+        Open a pooled connection to the provider before the first request.
+        
+        Sends a HEAD request so DNS, TCP and TLS setup happen off the
+        user's critical path; the response and any failure are ignored.
+        """
+        url = self._warmup_url()
+        if url is None:
+            return
+        try:
+            await self._get_http_client().head(url, timeout=5.0)
+        except Exception:
+            pass
+    
+    async def aclose(self):
+        """Close the HTTP client if this provider created it."""
+        if self._owns_http_client and self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+            self._owns_http_client = False
+    
+    async def _post(self, client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+        """
+        POST a request, backing off and retrying transient failures.
+        
+        Rate-limited and unavailable responses (429, 503) and network errors
+        are retried; a ``Retry-After`` header sets the wait when present.
+        
+        Args:
+            client: HTTP client to send the request with
+            url: Request URL
+            **kwargs: Arguments forwarded to ``client.post``
+            
+        Returns:
+            The final response, which may still be an error after retries
+            
+        Raises:
+            httpx.TransportError: If the last attempt failed at the network level
+        """
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.RETRY_ATTEMPTS),
+            wait=self._retry_wait,
+            retry=(
+                retry_if_exception_type(self.RETRY_EXCEPTIONS)
+                | retry_if_result(
+                    lambda response: response.status_code in self.RETRY_STATUS_CODES
+                )
+            ),
+            retry_error_callback=lambda state: state.outcome.result()
+        )
+        return await retrying(client.post, url, **kwargs)
+    
+    @staticmethod
+    def _body_excerpt(response: httpx.Response, limit: int = 500) -> str:
+        """Decode the start of a response body, e.g. an HTML error page."""
+        return response.content[:limit].decode(
+            response.encoding or "utf-8",
+            errors="replace"
+        )
+    
+    def _retry_wait(self, retry_state: RetryCallState) -> float:
+        """Wait as long as the server's Retry-After asks, else back off exponentially."""
+        outcome = retry_state.outcome
+        if not outcome.failed:
+            delay = _retry_after(outcome.result())
+            if delay is not None:
+                return min(delay, self.RETRY_AFTER_MAX)
+        return _BACKOFF(retry_state)
     
     def _measure_latency(self, func):
         """Decorator to measure function execution time."""
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = await func(*args, **kwargs)
-            latency = time.time() - start_time
+            latency = time.perf_counter() - start_time
             return result, latency
         return wrapper
@@ -2,33 +2,67 @@
 Google Gemini API provider for Multi-LLM System.
 """
 import time
-from typing import Optional
+from functools import lru_cache
+from typing import AsyncIterator, Optional
 from .base import BaseLLMProvider, LLMResponse
 
 
+@lru_cache(maxsize=8)
+def _build_gemini_client(api_key: str, model: str, system: Optional[str] = None):
+    """
+    Build a Gemini model client, shared by every provider with the same key.
+    
+    Args:
+        api_key: Google API key
+        model: Model name
+        system: Optional system instruction baked into the client
+        
+    Returns:
+        GenerativeModel instance
+        
+    Raises:
+        ImportError: If google-generativeai is not installed
+    """
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model, system_instruction=system)
+
+
 class GeminiProvider(BaseLLMProvider):
     """Provider for Google Gemini API."""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gemini-pro"):
+    # Free tier allows only a few requests per minute
+    MAX_CONCURRENCY = 2
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gemini-pro",
+        max_concurrency: Optional[int] = None
+    ):
         """
         Initialize Gemini provider.
         
         Args:
             api_key: Google API key
             model: Model to use (default: gemini-pro)
+            max_concurrency: Maximum simultaneous requests (default: MAX_CONCURRENCY)
         """
-        super().__init__(api_key)
+        super().__init__(api_key, max_concurrency=max_concurrency)
         self.model = model
         self._client = None
     
-    def _get_client(self):
+    def _get_client(self, system: Optional[str] = None):
         """Lazy initialization of Gemini client."""
-        if self._client is None:
+        if system and self.api_key:
+            # Clients per system instruction are cached by the builder
+            try:
+                return _build_gemini_client(self.api_key, self.model, system)
+            except ImportError:
+                return None
+        if self._client is None and self.api_key:
             try:
-                import google.generativeai as genai
-                if self.api_key:
-                    genai.configure(api_key=self.api_key)
-                    self._client = genai.GenerativeModel(self.model)
+                self._client = _build_gemini_client(self.api_key, self.model)
             except ImportError:
                 pass
         return self._client
@@ -37,18 +71,18 @@ class GeminiProvider(BaseLLMProvider):
         """Return the model name."""
         return self.model
     
-    async def generate_async(self, prompt: str, **kwargs) -> LLMResponse:
+    async def _generate_async(self, prompt: str, **kwargs) -> LLMResponse:
         """
         Generate a response using Gemini API.
         
         Args:
             prompt: The input prompt
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (system)
             
         Returns:
             LLMResponse object
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         if not self.api_key:
             return LLMResponse(
@@ -58,7 +92,7 @@ class GeminiProvider(BaseLLMProvider):
                 error="Gemini API key not provided"
             )
         
-        client = self._get_client()
+        client = self._get_client(kwargs.get("system"))
         if client is None:
             return LLMResponse(
                 model_name=self.model,
@@ -68,9 +102,9 @@ class GeminiProvider(BaseLLMProvider):
             )
         
         try:
-            # Generate content
-            response = client.generate_content(prompt)
-            latency = time.time() - start_time
+            # Generate content without blocking the event loop
+            response = await client.generate_content_async(prompt)
+            latency = time.perf_counter() - start_time
             
             # Extract text from response
             if hasattr(response, 'text'):
@@ -88,10 +122,32 @@ class GeminiProvider(BaseLLMProvider):
             )
             
         except Exception as e:
-            latency = time.time() - start_time
+            latency = time.perf_counter() - start_time
             return LLMResponse(
                 model_name=self.model,
                 content="",
                 latency=latency,
                 error=f"Request failed: {str(e)}"
             )
+    
+    async def _stream_async(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream a response from Gemini API.
+        
+        Args:
+            prompt: The input prompt
+            **kwargs: Additional parameters (system)
+            
+        Yields:
+            Text chunks as they are produced
+        """
+        if not self.api_key:
+            raise RuntimeError("Gemini API key not provided")
+        
+        client = self._get_client(kwargs.get("system"))
+        if client is None:
+            raise RuntimeError("google-generativeai package not installed")
+        
+        response = await client.generate_content_async(prompt, stream=True)
+        async for chunk in response:
+            yield chunk.text
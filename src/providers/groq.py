@@ -2,10 +2,16 @@
 Groq API provider for Multi-LLM System.
 Known for extremely fast inference speeds.
 """
+import asyncio
 import time
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from .base import BaseLLMProvider, LLMResponse
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 
 class GroqProvider(BaseLLMProvider):
     """Provider for Groq API (very fast inference)."""
@@ -17,44 +23,93 @@ class GroqProvider(BaseLLMProvider):
         "gemma-7b-it"
     ]
     
-    def __init__(self, api_key: Optional[str] = None, model: str = None):
+    # Batch jobs finish within this window, at a discount on token prices
+    BATCH_COMPLETION_WINDOW = "24h"
+    # Seconds between batch status checks, doubling up to the maximum
+    BATCH_POLL_INTERVAL = 5.0
+    BATCH_POLL_MAX = 300.0
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = None,
+        max_concurrency: Optional[int] = None
+    ):
         """
         Initialize Groq provider.
         
         Args:
             api_key: Groq API key
             model: Model to use (default: llama3-8b-8192)
+            max_concurrency: Maximum simultaneous requests (default: MAX_CONCURRENCY)
         """
-        super().__init__(api_key)
+        super().__init__(api_key, max_concurrency=max_concurrency)
         self.model = model or self.DEFAULT_MODELS[0]
         self._client = None
+        self._client_http = None
     
     def _get_client(self):
         """Lazy initialization of Groq client."""
-        if self._client is None and self.api_key:
+        if not self.api_key:
+            return None
+        # Rebuilt when the HTTP client changes, e.g. on another event loop
+        http_client = self._get_http_client()
+        if self._client is None or self._client_http is not http_client:
             try:
                 from groq import AsyncGroq
-                self._client = AsyncGroq(api_key=self.api_key)
+                self._client = AsyncGroq(
+                    api_key=self.api_key,
+                    http_client=http_client
+                )
+                self._client_http = http_client
             except ImportError:
                 pass
         return self._client
     
+    async def warmup(self):
+        """
+        Open the connection to Groq ahead of the first request.
+        
+        Listing models is cheap and does not use completion quota;
+        failures are ignored, as the real request will report them.
+        """
+        client = self._get_client()
+        if client is None:
+            return
+        try:
+            await client.models.list()
+        except Exception:
+            pass
+    
     def get_model_name(self) -> str:
         """Return the model name."""
         return self.model
     
-    async def generate_async(self, prompt: str, **kwargs) -> LLMResponse:
+    def _completion_params(self, prompt: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the chat completion parameters for a prompt."""
+        messages = [{"role": "user", "content": prompt}]
+        if kwargs.get("system"):
+            # Groq caches repeated prompt prefixes automatically
+            messages.insert(0, {"role": "system", "content": kwargs["system"]})
+        return {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": kwargs.get("max_tokens", 1024),
+            "temperature": kwargs.get("temperature", 0.7)
+        }
+    
+    async def _generate_async(self, prompt: str, **kwargs) -> LLMResponse:
         """
         Generate a response using Groq API.
         
         Args:
             prompt: The input prompt
-            **kwargs: Additional parameters (max_tokens, temperature, etc.)
+            **kwargs: Additional parameters (system, max_tokens, temperature, etc.)
             
         Returns:
             LLMResponse object
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         if not self.api_key:
             return LLMResponse(
@@ -76,15 +131,10 @@ class GroqProvider(BaseLLMProvider):
         try:
             # Create chat completion
             response = await client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=kwargs.get("max_tokens", 1024),
-                temperature=kwargs.get("temperature", 0.7)
+                **self._completion_params(prompt, kwargs)
             )
             
-            latency = time.time() - start_time
+            latency = time.perf_counter() - start_time
             
             content = response.choices[0].message.content
             tokens_used = response.usage.total_tokens if hasattr(response, 'usage') else None
@@ -98,10 +148,145 @@ class GroqProvider(BaseLLMProvider):
             )
             
         except Exception as e:
-            latency = time.time() - start_time
+            latency = time.perf_counter() - start_time
             return LLMResponse(
                 model_name=self.model,
                 content="",
                 latency=latency,
                 error=f"Request failed: {str(e)}"
             )
+    
+    async def _stream_async(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream a response from Groq API.
+        
+        Args:
+            prompt: The input prompt
+            **kwargs: Additional parameters (system, max_tokens, temperature, etc.)
+            
+        Yields:
+            Text chunks as they are produced
+        """
+        if not self.api_key:
+            raise RuntimeError("Groq API key not provided")
+        
+        client = self._get_client()
+        if client is None:
+            raise RuntimeError("groq package not installed")
+        
+        stream = await client.chat.completions.create(
+            **self._completion_params(prompt, kwargs),
+            stream=True
+        )
+        # Closes the response even when the consumer stops early, so the
+        # connection goes back to the pool
+        async with stream:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+    
+    async def batch_generate(self, prompts: List[str], **kwargs) -> List[LLMResponse]:
+        """
+        Generate responses for many prompts through Groq's Batch API.
+        
+        Batched tokens are cheaper, but a job may take up to
+        BATCH_COMPLETION_WINDOW to finish, so this suits offline
+        workloads such as evaluation sweeps rather than interactive use.
+        
+        Args:
+            prompts: Input prompts
+            **kwargs: Additional parameters (system, max_tokens, temperature, etc.)
+            
+        Returns:
+            One LLMResponse per prompt, in the same order
+        """
+        start_time = time.perf_counter()
+        
+        def failed(error: str) -> List[LLMResponse]:
+            return [
+                LLMResponse(model_name=self.model, content="", latency=0.0, error=error)
+                for _ in prompts
+            ]
+        
+        if not self.api_key:
+            return failed("Groq API key not provided")
+        
+        client = self._get_client()
+        if client is None:
+            return failed("groq package not installed")
+        
+        lines = (
+            _json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._completion_params(prompt, kwargs)
+            })
+            for i, prompt in enumerate(prompts)
+        )
+        # orjson returns bytes, the stdlib fallback str
+        requests = b"\n".join(
+            line if isinstance(line, bytes) else line.encode("utf-8")
+            for line in lines
+        )
+        
+        try:
+            uploaded = await client.files.create(
+                file=("batch.jsonl", requests),
+                purpose="batch"
+            )
+            batch = await client.batches.create(
+                input_file_id=uploaded.id,
+                endpoint="/v1/chat/completions",
+                completion_window=self.BATCH_COMPLETION_WINDOW
+            )
+            
+            delay = self.BATCH_POLL_INTERVAL
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.BATCH_POLL_MAX)
+                batch = await client.batches.retrieve(batch.id)
+            
+            # Successful requests are in the output file, failed ones in
+            # the error file
+            results = {}
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if not file_id:
+                    continue
+                output = await client.files.content(file_id)
+                for line in (await output.text()).splitlines():
+                    if line:
+                        result = _json.loads(line)
+                        results[result["custom_id"]] = result
+        except Exception as e:
+            return failed(f"Batch request failed: {str(e)}")
+        
+        latency = time.perf_counter() - start_time
+        responses = []
+        for i in range(len(prompts)):
+            result = results.get(str(i))
+            # Error lines may carry a null response
+            body = ((result or {}).get("response") or {}).get("body") or {}
+            if not body.get("choices"):
+                error = (
+                    (result or {}).get("error")
+                    or body.get("error")
+                    or f"No result (batch {batch.status})"
+                )
+                if isinstance(error, dict):
+                    error = error.get("message", error)
+                responses.append(LLMResponse(
+                    model_name=self.model,
+                    content="",
+                    latency=latency,
+                    error=f"Request failed: {error}"
+                ))
+                continue
+            responses.append(LLMResponse(
+                model_name=self.model,
+                content=body["choices"][0]["message"]["content"],
+                latency=latency,
+                tokens_used=body.get("usage", {}).get("total_tokens"),
+                estimated_cost=0.0  # Free tier
+            ))
+        return responses
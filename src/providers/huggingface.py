@@ -1,11 +1,15 @@
 """
 Hugging Face Inference API provider for Multi-LLM System.
 """
-import httpx
 import time
-from typing import Optional
+from typing import Dict, Optional
 from .base import BaseLLMProvider, LLMResponse
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 
 class HuggingFaceProvider(BaseLLMProvider):
     """Provider for Hugging Face Inference API."""
@@ -19,33 +23,56 @@ class HuggingFaceProvider(BaseLLMProvider):
         "HuggingFaceH4/zephyr-7b-beta"
     ]
     
-    def __init__(self, api_key: Optional[str] = None, model: str = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = None,
+        max_concurrency: Optional[int] = None
+    ):
         """
         Initialize HuggingFace provider.
         
         Args:
             api_key: HuggingFace API token
             model: Model to use (defaults to Mistral-7B-Instruct)
+            max_concurrency: Maximum simultaneous requests (default: MAX_CONCURRENCY)
         """
-        super().__init__(api_key)
+        super().__init__(api_key, max_concurrency=max_concurrency)
         self.model = model or self.DEFAULT_MODELS[0]
+        self._url = f"{self.BASE_URL}{self.model}"
+        self._cached_headers: Dict[str, str] = {}
+        self._headers_key: Optional[str] = None
     
     def get_model_name(self) -> str:
         """Return the model name."""
         return self.model
     
-    async def generate_async(self, prompt: str, **kwargs) -> LLMResponse:
+    def _warmup_url(self) -> str:
+        """Return the URL requested by ``warmup``."""
+        return self._url
+    
+    def _headers(self) -> Dict[str, str]:
+        """Return the request headers, rebuilt only when the API key changes."""
+        if self._headers_key != self.api_key:
+            self._cached_headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            }
+            self._headers_key = self.api_key
+        return self._cached_headers
+    
+    async def _generate_async(self, prompt: str, **kwargs) -> LLMResponse:
         """
         Generate a response using HuggingFace API.
         
         Args:
             prompt: The input prompt
-            **kwargs: Additional parameters (max_new_tokens, temperature, etc.)
+            **kwargs: Additional parameters (system, max_tokens, temperature, etc.)
             
         Returns:
             LLMResponse object
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         if not self.api_key:
             return LLMResponse(
@@ -55,10 +82,8 @@ class HuggingFaceProvider(BaseLLMProvider):
                 error="HuggingFace API key not provided"
             )
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        if kwargs.get("system"):
+            prompt = f"{kwargs['system']}\n\n{prompt}"
         
         payload = {
             "inputs": prompt,
@@ -70,49 +95,53 @@ class HuggingFaceProvider(BaseLLMProvider):
         }
         
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{self.BASE_URL}{self.model}",
-                    headers=headers,
-                    json=payload
+            client = self._get_http_client()
+            response = await self._post(
+                client,
+                self._url,
+                headers=self._headers(),
+                content=_json.dumps(payload),
+                timeout=self.TIMEOUT
+            )
+            
+            latency = time.perf_counter() - start_time
+            
+            if response.status_code == 200:
+                result = _json.loads(response.content)
+                
+                # Handle different response formats
+                if isinstance(result, list) and len(result) > 0:
+                    content = result[0].get("generated_text", "")
+                elif isinstance(result, dict):
+                    content = result.get("generated_text", "")
+                else:
+                    content = str(result)
+                
+                return LLMResponse(
+                    model_name=self.model,
+                    content=content,
+                    latency=latency,
+                    estimated_cost=0.0  # Free tier
                 )
+            else:
+                error_msg = f"API error: {response.status_code}"
+                try:
+                    error_detail = _json.loads(response.content)
+                except ValueError:
+                    # Not JSON, e.g. an HTML error page from a proxy
+                    error_detail = self._body_excerpt(response)
+                if error_detail:
+                    error_msg += f" - {error_detail}"
                 
-                latency = time.time() - start_time
+                return LLMResponse(
+                    model_name=self.model,
+                    content="",
+                    latency=latency,
+                    error=error_msg
+                )
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    
-                    # Handle different response formats
-                    if isinstance(result, list) and len(result) > 0:
-                        content = result[0].get("generated_text", "")
-                    elif isinstance(result, dict):
-                        content = result.get("generated_text", "")
-                    else:
-                        content = str(result)
-                    
-                    return LLMResponse(
-                        model_name=self.model,
-                        content=content,
-                        latency=latency,
-                        estimated_cost=0.0  # Free tier
-                    )
-                else:
-                    error_msg = f"API error: {response.status_code}"
-                    try:
-                        error_detail = response.json()
-                        error_msg += f" - {error_detail}"
-                    except (ValueError, KeyError):
-                        pass
-                    
-                    return LLMResponse(
-                        model_name=self.model,
-                        content="",
-                        latency=latency,
-                        error=error_msg
-                    )
-                    
         except Exception as e:
-            latency = time.time() - start_time
+            latency = time.perf_counter() - start_time
             return LLMResponse(
                 model_name=self.model,
                 content="",
@@ -4,28 +4,49 @@ Completely free, runs models locally.
 """
 import httpx
 import time
-from typing import Optional
+from typing import AsyncIterator, Optional
 from .base import BaseLLMProvider, LLMResponse
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 
 class OllamaProvider(BaseLLMProvider):
     """Provider for Ollama (local inference)."""
     
+    # Local generation can be slow on modest hardware
+    TIMEOUT = 120.0
+    
+    # Bodies are serialized by hand, so the content type is set explicitly
+    HEADERS = {"Content-Type": "application/json"}
+    
+    # A refused connection means Ollama is not running; retrying only
+    # delays the error
+    RETRY_EXCEPTIONS = ()
+    
     DEFAULT_MODELS = [
         "llama3",
         "mistral",
         "phi3"
     ]
     
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = None):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        model: str = None,
+        max_concurrency: Optional[int] = None
+    ):
         """
         Initialize Ollama provider.
         
         Args:
             base_url: Ollama server URL
             model: Model to use (default: llama3)
+            max_concurrency: Maximum simultaneous requests (default: MAX_CONCURRENCY)
         """
-        super().__init__(None)  # No API key needed
+        super().__init__(None, max_concurrency=max_concurrency)  # No API key needed
         self.base_url = base_url
         self.model = model or self.DEFAULT_MODELS[0]
     
@@ -33,54 +54,65 @@ class OllamaProvider(BaseLLMProvider):
         """Return the model name."""
         return f"ollama/{self.model}"
     
-    async def generate_async(self, prompt: str, **kwargs) -> LLMResponse:
+    def _warmup_url(self) -> str:
+        """Return the URL requested by ``warmup``."""
+        return self.base_url
+    
+    async def _generate_async(self, prompt: str, **kwargs) -> LLMResponse:
         """
         Generate a response using Ollama API.
         
         Args:
             prompt: The input prompt
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (system)
             
         Returns:
             LLMResponse object
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         payload = {
             "model": self.model,
             "prompt": prompt,
             "stream": False
         }
+        if kwargs.get("system"):
+            payload["system"] = kwargs["system"]
         
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/generate",
-                    json=payload
-                )
+            client = self._get_http_client()
+            response = await self._post(
+                client,
+                f"{self.base_url}/api/generate",
+                headers=self.HEADERS,
+                content=_json.dumps(payload),
+                timeout=self.TIMEOUT
+            )
+            
+            latency = time.perf_counter() - start_time
+            
+            if response.status_code == 200:
+                result = _json.loads(response.content)
+                content = result.get("response", "")
                 
-                latency = time.time() - start_time
+                return LLMResponse(
+                    model_name=f"ollama/{self.model}",
+                    content=content,
+                    latency=latency,
+                    estimated_cost=0.0  # Completely free (local)
+                )
+            else:
+                return LLMResponse(
+                    model_name=f"ollama/{self.model}",
+                    content="",
+                    latency=latency,
+                    error=f"Ollama API error: {response.status_code}"
+                )
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    content = result.get("response", "")
-                    
-                    return LLMResponse(
-                        model_name=f"ollama/{self.model}",
-                        content=content,
-                        latency=latency,
-                        estimated_cost=0.0  # Completely free (local)
-                    )
-                else:
-                    return LLMResponse(
-                        model_name=f"ollama/{self.model}",
-                        content="",
-                        latency=latency,
-                        error=f"Ollama API error: {response.status_code}"
-                    )
-                    
         except httpx.ConnectError:
-            latency = time.time() - start_time
+            # Ollama is not running, so stop trying for a while
+            self.breaker.trip()
+            latency = time.perf_counter() - start_time
             return LLMResponse(
                 model_name=f"ollama/{self.model}",
                 content="",
@@ -88,10 +120,54 @@ class OllamaProvider(BaseLLMProvider):
                 error="Cannot connect to Ollama. Is it running? Install from https://ollama.ai/"
             )
         except Exception as e:
-            latency = time.time() - start_time
+            latency = time.perf_counter() - start_time
             return LLMResponse(
                 model_name=f"ollama/{self.model}",
                 content="",
                 latency=latency,
                 error=f"Request failed: {str(e)}"
             )
+    
+    async def _stream_async(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream a response from Ollama API.
+        
+        Args:
+            prompt: The input prompt
+            **kwargs: Additional parameters (system)
+            
+        Yields:
+            Text chunks as they are produced
+        """
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": True
+        }
+        if kwargs.get("system"):
+            payload["system"] = kwargs["system"]
+        
+        client = self._get_http_client()
+        try:
+            async with client.stream(
+                "POST",
+                f"{self.base_url}/api/generate",
+                headers=self.HEADERS,
+                content=_json.dumps(payload),
+                timeout=self.TIMEOUT
+            ) as response:
+                if response.status_code != 200:
+                    raise RuntimeError(f"Ollama API error: {response.status_code}")
+                
+                # One JSON object per line, the last one marked "done"
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = _json.loads(line)
+                    if chunk.get("response"):
+                        yield chunk["response"]
+        except httpx.ConnectError:
+            self.breaker.trip()
+            raise RuntimeError(
+                "Cannot connect to Ollama. Is it running? Install from https://ollama.ai/"
+            ) from None
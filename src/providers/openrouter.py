@@ -2,17 +2,24 @@
 OpenRouter API provider for Multi-LLM System.
 Provides access to multiple free models.
 """
-import httpx
 import time
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from .base import BaseLLMProvider, LLMResponse
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 
 class OpenRouterProvider(BaseLLMProvider):
     """Provider for OpenRouter API."""
     
     BASE_URL = "https://openrouter.ai/api/v1/chat/completions"
     
+    # Free models are limited to a few requests per minute
+    MAX_CONCURRENCY = 2
+    
     # Free models available on OpenRouter
     DEFAULT_MODELS = [
         "meta-llama/llama-3-8b-instruct:free",
@@ -20,33 +27,79 @@ class OpenRouterProvider(BaseLLMProvider):
         "mistralai/mistral-7b-instruct:free"
     ]
     
-    def __init__(self, api_key: Optional[str] = None, model: str = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = None,
+        max_concurrency: Optional[int] = None
+    ):
         """
         Initialize OpenRouter provider.
         
         Args:
             api_key: OpenRouter API key
             model: Model to use (default: llama-3-8b-instruct:free)
+            max_concurrency: Maximum simultaneous requests (default: MAX_CONCURRENCY)
         """
-        super().__init__(api_key)
+        super().__init__(api_key, max_concurrency=max_concurrency)
         self.model = model or self.DEFAULT_MODELS[0]
+        self._cached_headers: Dict[str, str] = {}
+        self._headers_key: Optional[str] = None
     
     def get_model_name(self) -> str:
         """Return the model name."""
         return self.model
     
-    async def generate_async(self, prompt: str, **kwargs) -> LLMResponse:
+    def _warmup_url(self) -> str:
+        """Return the URL requested by ``warmup``."""
+        return self.BASE_URL
+    
+    def _headers(self) -> Dict[str, str]:
+        """Return the request headers, rebuilt only when the API key changes."""
+        if self._headers_key != self.api_key:
+            self._cached_headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+                "HTTP-Referer": "https://github.com/multi-llm-system",
+                "X-Title": "Multi-LLM System"
+            }
+            self._headers_key = self.api_key
+        return self._cached_headers
+    
+    @staticmethod
+    def _messages(prompt: str, kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Build the chat messages for a prompt.
+        
+        With ``cache_prefix`` the system prompt carries a cache_control
+        marker, which OpenRouter forwards to models with prompt caching.
+        """
+        messages = [{"role": "user", "content": prompt}]
+        system = kwargs.get("system")
+        if system:
+            if kwargs.get("cache_prefix"):
+                content = [{
+                    "type": "text",
+                    "text": system,
+                    "cache_control": {"type": "ephemeral"}
+                }]
+            else:
+                content = system
+            messages.insert(0, {"role": "system", "content": content})
+        return messages
+    
+    async def _generate_async(self, prompt: str, **kwargs) -> LLMResponse:
         """
         Generate a response using OpenRouter API.
         
         Args:
             prompt: The input prompt
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (system, cache_prefix)
             
         Returns:
             LLMResponse object
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         if not self.api_key:
             return LLMResponse(
@@ -56,62 +109,102 @@ class OpenRouterProvider(BaseLLMProvider):
                 error="OpenRouter API key not provided"
             )
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/multi-llm-system",
-            "X-Title": "Multi-LLM System"
-        }
-        
         payload = {
             "model": self.model,
-            "messages": [
-                {"role": "user", "content": prompt}
-            ]
+            "messages": self._messages(prompt, kwargs)
         }
         
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    self.BASE_URL,
-                    headers=headers,
-                    json=payload
+            client = self._get_http_client()
+            response = await self._post(
+                client,
+                self.BASE_URL,
+                headers=self._headers(),
+                content=_json.dumps(payload),
+                timeout=self.TIMEOUT
+            )
+            
+            latency = time.perf_counter() - start_time
+            
+            if response.status_code == 200:
+                result = _json.loads(response.content)
+                content = result["choices"][0]["message"]["content"]
+                tokens_used = result.get("usage", {}).get("total_tokens")
+                
+                return LLMResponse(
+                    model_name=self.model,
+                    content=content,
+                    latency=latency,
+                    tokens_used=tokens_used,
+                    estimated_cost=0.0  # Free models
                 )
+            else:
+                error_msg = f"API error: {response.status_code}"
+                try:
+                    error_detail = _json.loads(response.content)
+                except ValueError:
+                    # Not JSON, e.g. an HTML error page from a proxy
+                    error_detail = self._body_excerpt(response)
+                if error_detail:
+                    error_msg += f" - {error_detail}"
                 
-                latency = time.time() - start_time
+                return LLMResponse(
+                    model_name=self.model,
+                    content="",
+                    latency=latency,
+                    error=error_msg
+                )
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    content = result["choices"][0]["message"]["content"]
-                    tokens_used = result.get("usage", {}).get("total_tokens")
-                    
-                    return LLMResponse(
-                        model_name=self.model,
-                        content=content,
-                        latency=latency,
-                        tokens_used=tokens_used,
-                        estimated_cost=0.0  # Free models
-                    )
-                else:
-                    error_msg = f"API error: {response.status_code}"
-                    try:
-                        error_detail = response.json()
-                        error_msg += f" - {error_detail}"
-                    except (ValueError, KeyError):
-                        pass
-                    
-                    return LLMResponse(
-                        model_name=self.model,
-                        content="",
-                        latency=latency,
-                        error=error_msg
-                    )
-                    
         except Exception as e:
-            latency = time.time() - start_time
+            latency = time.perf_counter() - start_time
             return LLMResponse(
                 model_name=self.model,
                 content="",
                 latency=latency,
                 error=f"Request failed: {str(e)}"
             )
+    
+    async def _stream_async(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream a response from OpenRouter API.
+        
+        Args:
+            prompt: The input prompt
+            **kwargs: Additional parameters (system, cache_prefix)
+            
+        Yields:
+            Text chunks as they are produced
+        """
+        if not self.api_key:
+            raise RuntimeError("OpenRouter API key not provided")
+        
+        payload = {
+            "model": self.model,
+            "messages": self._messages(prompt, kwargs),
+            "stream": True
+        }
+        
+        client = self._get_http_client()
+        async with client.stream(
+            "POST",
+            self.BASE_URL,
+            headers=self._headers(),
+            content=_json.dumps(payload),
+            timeout=self.TIMEOUT
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                raise RuntimeError(
+                    f"API error: {response.status_code} - {self._body_excerpt(response)}"
+                )
+            
+            # Server-sent events; lines starting with ":" are keep-alive comments
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                choices = _json.loads(data).get("choices")
+                if choices and choices[0].get("delta", {}).get("content"):
+                    yield choices[0]["delta"]["content"]
@@ -2,9 +2,19 @@
 Multi-LLM Router for intelligent model selection and comparison.
 """
 import asyncio
-from typing import List, Dict, Optional
+import functools
+import time
+from contextlib import AsyncExitStack
+from typing import AsyncIterator, Iterator, List, Dict, Optional, Set, Tuple, Union
 from enum import Enum
-from .providers.base import BaseLLMProvider, LLMResponse
+from .providers.base import (
+    BaseLLMProvider,
+    LLMResponse,
+    LoopLocalHTTPClient,
+    iterate_sync,
+    run_sync
+)
+from .cache import LLMCache, SemanticCache
 
 
 class UseCase(Enum):
@@ -20,15 +30,66 @@ class MultiLLMRouter:
     
     # Provider preferences by use case
     USE_CASE_PREFERENCES = {
-        UseCase.HEALTHCARE: ["gemini", "groq", "huggingface"],  # Prefer reliable, accurate models
-        UseCase.ACCESSIBILITY: ["groq", "gemini", "openrouter"],  # Prefer fast, clear responses
-        UseCase.GENERAL: ["groq", "ollama", "gemini"],  # Balance of speed and quality
-        UseCase.COST_SENSITIVE: ["ollama", "groq", "openrouter"]  # Prefer free/local models
+        UseCase.HEALTHCARE: ("gemini", "groq", "huggingface"),  # Prefer reliable, accurate models
+        UseCase.ACCESSIBILITY: ("groq", "gemini", "openrouter"),  # Prefer fast, clear responses
+        UseCase.GENERAL: ("groq", "ollama", "gemini"),  # Balance of speed and quality
+        UseCase.COST_SENSITIVE: ("ollama", "groq", "openrouter")  # Prefer free/local models
     }
+    USE_CASE_PREFERENCE_SETS = {
+        use_case: frozenset(names) for use_case, names in USE_CASE_PREFERENCES.items()
+    }
+    
+    # Seconds to wait for a single provider before reporting a timeout
+    PROVIDER_TIMEOUT = 30.0
+    
+    # Providers queried at once by query_all
+    MAX_CONCURRENCY = 16
     
-    def __init__(self):
-        """Initialize the router."""
+    def __init__(
+        self,
+        cache: Optional[SemanticCache] = None,
+        response_cache: Optional[LLMCache] = None
+    ):
+        """
+        Initialize the router.
+        
+        Args:
+            cache: Optional semantic cache consulted before best-provider queries
+            response_cache: Optional exact-match cache given to every registered
+                provider that has none, so repeated prompts skip the network
+                in both best-provider and compare-all queries
+        """
         self.providers: Dict[str, BaseLLMProvider] = {}
+        self.cache = cache
+        
+        # (preferred, fallback) provider order per use case, rebuilt
+        # whenever a provider is registered
+        self._candidate_cache: Dict[UseCase, Tuple[List, List]] = {}
+        self.response_cache = response_cache
+        
+        # Provider calls in progress, keyed by (event loop, provider name,
+        # request key), so identical concurrent requests share a single call.
+        # A future can only be awaited on its own loop, and each loop only
+        # touches its own keys, so the sync API's background loop and
+        # asyncio.run callers on other threads never share an entry
+        self._inflight: Dict[Tuple[asyncio.AbstractEventLoop, str, str], asyncio.Future] = {}
+        self._waiters: Dict[asyncio.Future, int] = {}
+        
+        # Fire-and-forget tasks such as provider warmups, referenced here
+        # so they are not garbage collected before they finish
+        self._background: Set = set()
+        
+        # Pooled clients shared by every provider, so connections and TLS
+        # sessions are reused across queries; one per event loop, as the
+        # router may be driven by asyncio.run as well as the sync methods
+        self._http_client = LoopLocalHTTPClient(
+            BaseLLMProvider.TIMEOUT,
+            BaseLLMProvider.HTTP_LIMITS
+        )
+        
+        # Everything stop() has to close, unwound in reverse order
+        self._exit_stack = AsyncExitStack()
+        self._exit_stack.push_async_callback(self._http_client.aclose)
     
     def register_provider(self, name: str, provider: BaseLLMProvider):
         """
@@ -38,7 +99,70 @@ class MultiLLMRouter:
             name: Unique name for the provider
             provider: Provider instance
         """
+        if provider.http_client is None:
+            provider.http_client = self._http_client
+        if provider.cache is None:
+            provider.cache = self.response_cache
         self.providers[name] = provider
+        self._candidate_cache.clear()
+        self._exit_stack.push_async_callback(provider.aclose)
+        
+        # Open the provider's connection before the first user request when
+        # a loop is running; otherwise start() or warmup() does it
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(provider.warmup())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+    
+    async def warmup_async(self):
+        """Open connections to every registered provider in parallel."""
+        await asyncio.gather(
+            *(provider.warmup() for provider in self.providers.values()),
+            return_exceptions=True
+        )
+    
+    def warmup(self):
+        """
+        Open connections to every registered provider (synchronous version).
+        
+        Runs on the background loop the synchronous methods use, so the
+        connections are pooled where those methods will need them.
+        """
+        run_sync(self.warmup_async())
+    
+    async def start(self):
+        """
+        Pre-connect to every provider.
+        
+        Optional: connections also open on first use.
+        """
+        await self.warmup_async()
+    
+    async def stop(self):
+        """Close the shared HTTP client and any clients owned by providers."""
+        await self._exit_stack.aclose()
+    
+    # Conventional name for async cleanup
+    aclose = stop
+    
+    async def __aenter__(self) -> "MultiLLMRouter":
+        await self.start()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+    
+    def close(self):
+        """
+        Close the HTTP clients (synchronous version).
+        
+        Runs on the background loop the synchronous methods use, which is
+        the loop the pooled connections belong to.
+        """
+        run_sync(self.stop())
     
     def get_provider(self, name: str) -> Optional[BaseLLMProvider]:
         """
@@ -61,87 +185,357 @@ class MultiLLMRouter:
         """
         return list(self.providers.keys())
     
-    async def query_all_async(self, prompt: str, **kwargs) -> Dict[str, LLMResponse]:
+    async def _generate_with_timeout(
+        self,
+        name: str,
+        provider: BaseLLMProvider,
+        prompt: str,
+        timeout: float,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Query one provider, converting timeouts and exceptions to responses.
+        
+        An identical request already in flight is joined instead of sent
+        again.
+        
+        Args:
+            name: Provider name
+            provider: Provider instance
+            prompt: The input prompt
+            timeout: Seconds to wait before giving up
+            **kwargs: Additional parameters for the provider
+            
+        Returns:
+            The provider's response, or a failed response
+        """
+        return await self._await_response(
+            name,
+            self._generate_shared(name, provider, prompt, **kwargs),
+            timeout,
+            provider
+        )
+    
+    @staticmethod
+    async def _await_response(
+        name: str,
+        call,
+        timeout: float,
+        provider: BaseLLMProvider
+    ) -> LLMResponse:
+        """
+        Await a provider call, converting timeouts and exceptions to responses.
+        
+        Args:
+            name: Provider name
+            call: Awaitable producing the provider's LLMResponse
+            timeout: Seconds to wait before giving up
+            provider: Provider being called, whose circuit breaker counts
+                a timeout as a failure
+            
+        Returns:
+            The provider's response, or a failed response
+        """
+        try:
+            return await asyncio.wait_for(call, timeout=timeout)
+        except asyncio.TimeoutError:
+            provider.breaker.record_failure()
+            return LLMResponse(
+                model_name=name,
+                content="",
+                latency=timeout,
+                error=f"Timed out after {timeout:g}s"
+            )
+        except Exception as e:
+            return LLMResponse(
+                model_name=name,
+                content="",
+                latency=0.0,
+                error=f"Exception: {str(e)}"
+            )
+    
+    async def _generate_shared(
+        self,
+        name: str,
+        provider: BaseLLMProvider,
+        prompt: str,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Query one provider, joining an identical request already in flight.
+        
+        Args:
+            name: Provider name
+            provider: Provider instance
+            prompt: The input prompt
+            **kwargs: Additional parameters for the provider
+            
+        Returns:
+            The provider's response
+        """
+        key = (
+            asyncio.get_running_loop(),
+            name,
+            LLMCache.make_key(provider.get_model_name(), prompt, kwargs)
+        )
+        future = self._inflight.get(key)
+        if future is None or future.cancelled():
+            future = asyncio.ensure_future(provider.generate_async(prompt, **kwargs))
+            self._inflight[key] = future
+            self._waiters[future] = 0
+            future.add_done_callback(functools.partial(self._forget, key))
+        
+        self._waiters[future] += 1
+        try:
+            # Shielded so one caller giving up does not cancel the others
+            return await asyncio.shield(future)
+        finally:
+            if future in self._waiters:
+                self._waiters[future] -= 1
+                if not self._waiters[future]:
+                    # Every caller has given up, so the call is abandoned.
+                    # Unlisted first: cancellation may take a while to
+                    # finish, and new callers must not join it meanwhile
+                    self._forget(key, future)
+                    future.cancel()
+    
+    def _forget(self, key: Tuple[asyncio.AbstractEventLoop, str, str], future: asyncio.Future):
+        """Drop a finished or abandoned call from the in-flight map."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        self._waiters.pop(future, None)
+    
+    async def query_all_async(
+        self,
+        prompt: str,
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, LLMResponse]:
         """
         Query all registered providers in parallel.
         
         Args:
             prompt: The input prompt
+            timeout: Per-provider timeout in seconds (default: PROVIDER_TIMEOUT)
+            max_concurrency: Providers queried at once (default: MAX_CONCURRENCY)
             **kwargs: Additional parameters for providers
             
         Returns:
             Dictionary mapping provider names to responses
         """
-        tasks = []
-        provider_names = []
+        timeout = self.PROVIDER_TIMEOUT if timeout is None else timeout
+        semaphore = asyncio.Semaphore(max_concurrency or self.MAX_CONCURRENCY)
+        provider_names = list(self.providers)
         
-        for name, provider in self.providers.items():
-            tasks.append(provider.generate_async(prompt, **kwargs))
-            provider_names.append(name)
-        
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        results = {}
-        for name, response in zip(provider_names, responses):
-            if isinstance(response, Exception):
-                # Handle exceptions
-                results[name] = LLMResponse(
-                    model_name=name,
-                    content="",
-                    latency=0.0,
-                    error=f"Exception: {str(response)}"
+        async def guarded(name: str, provider: BaseLLMProvider) -> LLMResponse:
+            # The timeout starts once a slot is free, not while queued
+            async with semaphore:
+                return await self._generate_with_timeout(
+                    name, provider, prompt, timeout, **kwargs
                 )
-            else:
-                results[name] = response
         
-        return results
+        responses = await asyncio.gather(*(
+            guarded(name, provider)
+            for name, provider in self.providers.items()
+        ))
+        
+        return dict(zip(provider_names, responses))
     
-    def query_all(self, prompt: str, **kwargs) -> Dict[str, LLMResponse]:
+    def query_all(
+        self,
+        prompt: str,
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, LLMResponse]:
         """
         Query all registered providers (synchronous version).
         
         Args:
             prompt: The input prompt
+            timeout: Per-provider timeout in seconds (default: PROVIDER_TIMEOUT)
+            max_concurrency: Providers queried at once (default: MAX_CONCURRENCY)
             **kwargs: Additional parameters for providers
             
         Returns:
             Dictionary mapping provider names to responses
         """
-        return asyncio.run(self.query_all_async(prompt, **kwargs))
+        return run_sync(self.query_all_async(
+            prompt,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+            **kwargs
+        ))
+    
+    async def stream_all_async(
+        self,
+        prompt: str,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator[Tuple[str, Union[str, LLMResponse]]]:
+        """
+        Stream every registered provider's answer concurrently.
+        
+        Chunks from different providers are interleaved in arrival order.
+        
+        Args:
+            prompt: The input prompt
+            timeout: Per-provider timeout in seconds (default: PROVIDER_TIMEOUT)
+            **kwargs: Additional parameters for providers
+            
+        Yields:
+            (provider name, item) pairs, where item is a text chunk or, once
+            that provider is finished, its complete LLMResponse
+        """
+        timeout = self.PROVIDER_TIMEOUT if timeout is None else timeout
+        queue: asyncio.Queue = asyncio.Queue()
+        
+        async def pump(name: str, provider: BaseLLMProvider):
+            start_time = time.perf_counter()
+            chunks = []
+            
+            async def consume():
+                async for chunk in provider.stream_async(prompt, **kwargs):
+                    chunks.append(chunk)
+                    await queue.put((name, chunk))
+            
+            error = None
+            try:
+                await asyncio.wait_for(consume(), timeout=timeout)
+            except asyncio.TimeoutError:
+                error = f"Timed out after {timeout:g}s"
+            except Exception as e:
+                error = f"Exception: {str(e)}"
+            await queue.put((name, LLMResponse(
+                model_name=provider.get_model_name(),
+                content="".join(chunks),
+                latency=time.perf_counter() - start_time,
+                error=error
+            )))
+        
+        tasks = [
+            asyncio.ensure_future(pump(name, provider))
+            for name, provider in self.providers.items()
+        ]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                name, item = await queue.get()
+                if isinstance(item, LLMResponse):
+                    remaining -= 1
+                yield name, item
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def stream_all(
+        self,
+        prompt: str,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> Iterator[Tuple[str, Union[str, LLMResponse]]]:
+        """
+        Stream every registered provider's answer (synchronous version).
+        
+        Args:
+            prompt: The input prompt
+            timeout: Per-provider timeout in seconds (default: PROVIDER_TIMEOUT)
+            **kwargs: Additional parameters for providers
+            
+        Yields:
+            (provider name, item) pairs, where item is a text chunk or, once
+            that provider is finished, its complete LLMResponse
+        """
+        return iterate_sync(self.stream_all_async(prompt, timeout=timeout, **kwargs))
+    
+    def _candidates(
+        self,
+        use_case: UseCase
+    ) -> Tuple[List[Tuple[str, BaseLLMProvider]], List[Tuple[str, BaseLLMProvider]]]:
+        """
+        Order registered providers for a use case.
+        
+        Args:
+            use_case: The use case category
+            
+        Returns:
+            Tuple of (preferred providers in preference order, every other
+            registered provider)
+        """
+        candidates = self._candidate_cache.get(use_case)
+        if candidates is None:
+            preferred_names = self.USE_CASE_PREFERENCE_SETS.get(use_case, frozenset())
+            preferred = [
+                (name, self.providers[name])
+                for name in self.USE_CASE_PREFERENCES.get(use_case, ())
+                if name in self.providers
+            ]
+            fallback = [
+                (name, provider)
+                for name, provider in self.providers.items()
+                if name not in preferred_names
+            ]
+            candidates = self._candidate_cache[use_case] = (preferred, fallback)
+        return candidates
+    
+    @staticmethod
+    def _cache_namespace(use_case: UseCase, kwargs: Dict) -> str:
+        """Build the cache partition for a use case and request parameters."""
+        return f"{use_case.value}:{sorted(kwargs.items())}"
+    
+    async def _cache_get(self, prompt: str, namespace: str) -> Optional[LLMResponse]:
+        """Look up the semantic cache in a worker thread, off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.cache.get, prompt, namespace=namespace)
+        )
+    
+    async def _cache_put(self, prompt: str, response: LLMResponse, namespace: str):
+        """Store in the semantic cache in a worker thread, off the event loop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, functools.partial(self.cache.put, prompt, response, namespace=namespace)
+        )
     
     async def query_best_for_use_case_async(
         self,
         prompt: str,
         use_case: UseCase,
+        timeout: Optional[float] = None,
         **kwargs
     ) -> LLMResponse:
         """
         Query the best provider for a specific use case.
         
+        The preferred providers for the use case are queried concurrently
+        and the first successful answer wins; the remaining providers are
+        only tried if every preferred one fails.
+        
         Args:
             prompt: The input prompt
             use_case: The use case category
+            timeout: Per-provider timeout in seconds (default: PROVIDER_TIMEOUT)
             **kwargs: Additional parameters for providers
             
         Returns:
             Response from the best available provider
         """
-        preferences = self.USE_CASE_PREFERENCES.get(use_case, [])
+        namespace = self._cache_namespace(use_case, kwargs)
+        if self.cache is not None:
+            cached = await self._cache_get(prompt, namespace)
+            if cached is not None:
+                return cached
         
-        # Try providers in order of preference
-        for provider_name in preferences:
-            provider = self.providers.get(provider_name)
-            if provider:
-                response = await provider.generate_async(prompt, **kwargs)
-                if response.success:
-                    return response
-        
-        # Fallback: try any available provider
-        for provider_name, provider in self.providers.items():
-            if provider_name not in preferences:
-                response = await provider.generate_async(prompt, **kwargs)
-                if response.success:
-                    return response
+        timeout = self.PROVIDER_TIMEOUT if timeout is None else timeout
+        for wave in self._candidates(use_case):
+            if not wave:
+                continue
+            response = await self._first_success(wave, prompt, timeout, **kwargs)
+            if response is not None:
+                if self.cache is not None:
+                    await self._cache_put(prompt, response, namespace)
+                return response
         
         # All providers failed
         return LLMResponse(
@@ -151,10 +545,50 @@ class MultiLLMRouter:
             error="No providers available or all providers failed"
         )
     
+    async def _first_success(
+        self,
+        candidates: List[Tuple[str, BaseLLMProvider]],
+        prompt: str,
+        timeout: float,
+        **kwargs
+    ) -> Optional[LLMResponse]:
+        """
+        Query providers concurrently and return the first successful response.
+        
+        Args:
+            candidates: (name, provider) pairs to race
+            prompt: The input prompt
+            timeout: Per-provider timeout in seconds
+            **kwargs: Additional parameters for providers
+            
+        Returns:
+            The first successful response, or None if every provider failed
+        """
+        tasks = [
+            asyncio.ensure_future(self._await_response(
+                name,
+                self._generate_shared(name, provider, prompt, **kwargs),
+                timeout,
+                provider
+            ))
+            for name, provider in candidates
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                response = await next_done
+                if response.success:
+                    return response
+            return None
+        finally:
+            # Stop the providers that lost the race
+            for task in tasks:
+                task.cancel()
+    
     def query_best_for_use_case(
         self,
         prompt: str,
         use_case: UseCase,
+        timeout: Optional[float] = None,
         **kwargs
     ) -> LLMResponse:
         """
@@ -163,13 +597,101 @@ class MultiLLMRouter:
         Args:
             prompt: The input prompt
             use_case: The use case category
+            timeout: Per-provider timeout in seconds (default: PROVIDER_TIMEOUT)
             **kwargs: Additional parameters for providers
             
         Returns:
             Response from the best available provider
         """
-        return asyncio.run(
-            self.query_best_for_use_case_async(prompt, use_case, **kwargs)
+        return run_sync(
+            self.query_best_for_use_case_async(prompt, use_case, timeout=timeout, **kwargs)
+        )
+    
+    async def stream_best_for_use_case_async(
+        self,
+        prompt: str,
+        use_case: UseCase,
+        **kwargs
+    ) -> AsyncIterator[Union[str, LLMResponse]]:
+        """
+        Stream the answer of the best provider for a specific use case.
+        
+        A provider that fails before producing any text is skipped in
+        favour of the next candidate.
+        
+        Args:
+            prompt: The input prompt
+            use_case: The use case category
+            **kwargs: Additional parameters for providers
+            
+        Yields:
+            Text chunks as they arrive, then the complete LLMResponse
+        """
+        namespace = self._cache_namespace(use_case, kwargs)
+        if self.cache is not None:
+            cached = await self._cache_get(prompt, namespace)
+            if cached is not None:
+                yield cached.content
+                yield cached
+                return
+        
+        preferred, fallback = self._candidates(use_case)
+        for provider_name, provider in preferred + fallback:
+            start_time = time.perf_counter()
+            chunks = []
+            try:
+                async for chunk in provider.stream_async(prompt, **kwargs):
+                    chunks.append(chunk)
+                    yield chunk
+            except Exception as e:
+                if not chunks:
+                    continue
+                # Text was already shown, so report the failure instead
+                yield LLMResponse(
+                    model_name=provider.get_model_name(),
+                    content="".join(chunks),
+                    latency=time.perf_counter() - start_time,
+                    error=f"Stream interrupted: {str(e)}"
+                )
+                return
+            
+            response = LLMResponse(
+                model_name=provider.get_model_name(),
+                content="".join(chunks),
+                latency=time.perf_counter() - start_time
+            )
+            if self.cache is not None:
+                await self._cache_put(prompt, response, namespace)
+            yield response
+            return
+        
+        # All providers failed
+        yield LLMResponse(
+            model_name="none",
+            content="",
+            latency=0.0,
+            error="No providers available or all providers failed"
+        )
+    
+    def stream_best_for_use_case(
+        self,
+        prompt: str,
+        use_case: UseCase,
+        **kwargs
+    ) -> Iterator[Union[str, LLMResponse]]:
+        """
+        Stream the best provider's answer (synchronous version).
+        
+        Args:
+            prompt: The input prompt
+            use_case: The use case category
+            **kwargs: Additional parameters for providers
+            
+        Yields:
+            Text chunks as they arrive, then the complete LLMResponse
+        """
+        return iterate_sync(
+            self.stream_best_for_use_case_async(prompt, use_case, **kwargs)
         )
     
     def get_use_case_explanation(self, use_case: UseCase) -> str: